@@ -6,6 +6,14 @@ class Settings(BaseSettings):
     OPENAI_API_KEY: str | None = None
     ANTHROPIC_API_KEY: str | None = None
 
+    # Max messages per chat sent to the LLM as context (None = unbounded).
+    # Oldest messages are evicted one at a time; if the window then starts
+    # with an assistant turn, that turn is skipped (see build_llm_history).
+    CHAT_CONTEXT_WINDOW: int | None = 50
+
+    # Max background jobs running LLM calls at once; extra jobs stay queued
+    MAX_CONCURRENT_JOBS: int = 16
+
     DEFAULT_MODELS: dict = {
         "openai": ["gpt-4o-mini", "gpt-4.1", "gpt-5.1"],
         "claude": ["claude-3-5-sonnet-latest", "claude-3-5-haiku-latest"],
@@ -1,9 +1,12 @@
 import os
-from typing import List, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Optional, Tuple
 
 from .base import LLMClient, ChatMessage
 from ..utils.logger import logger
 
+if TYPE_CHECKING:
+    import httpx
+
 try:
     import anthropic
 except ImportError:
@@ -11,12 +14,20 @@ except ImportError:
 
 
 class AnthropicClient(LLMClient):
-    def __init__(self, model: str, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        model: str,
+        api_key: Optional[str] = None,
+        http_client: Optional["httpx.AsyncClient"] = None,
+    ):
         if anthropic is None:
             logger.warning("anthropic package not installed; Claude calls will be mocked")
             self.client = None
         else:
-            self.client = anthropic.AsyncAnthropic(api_key=api_key or os.getenv("ANTHROPIC_API_KEY"))
+            self.client = anthropic.AsyncAnthropic(
+                api_key=api_key or os.getenv("ANTHROPIC_API_KEY"),
+                http_client=http_client,
+            )
         self.model = model
 
     async def chat(self, messages: List[ChatMessage]) -> str:
@@ -24,13 +35,7 @@ class AnthropicClient(LLMClient):
             joined = "\n".join(f"{m.role}: {m.content}" for m in messages)
             return f"[MOCK CLAUDE {self.model}] Generated TS/FS based on:\n{joined[:1000]}"
 
-        # For Claude, separate system + user/assistant blocks
-        system_msg = "\n".join(m.content for m in messages if m.role == "system") or None
-        user_blocks = [
-            {"role": m.role, "content": m.content}
-            for m in messages
-            if m.role in ("user", "assistant")
-        ]
+        system_msg, user_blocks = _split_messages(messages)
         resp = await self.client.messages.create(
             model=self.model,
             max_tokens=4096,
@@ -38,3 +43,31 @@ class AnthropicClient(LLMClient):
             messages=user_blocks,
         )
         return resp.content[0].text
+
+    async def stream_chat(self, messages: List[ChatMessage]) -> AsyncIterator[str]:
+        if self.client is None:
+            yield await self.chat(messages)
+            return
+
+        system_msg, user_blocks = _split_messages(messages)
+        async with self.client.messages.stream(
+            model=self.model,
+            max_tokens=4096,
+            system=system_msg,
+            messages=user_blocks,
+        ) as stream:
+            async for text in stream.text_stream:
+                yield text
+
+
+def _split_messages(
+    messages: List[ChatMessage],
+) -> Tuple[Optional[str], List[Dict[str, str]]]:
+    # For Claude, separate system + user/assistant blocks
+    system_msg = "\n".join(m.content for m in messages if m.role == "system") or None
+    user_blocks = [
+        {"role": m.role, "content": m.content}
+        for m in messages
+        if m.role in ("user", "assistant")
+    ]
+    return system_msg, user_blocks
@@ -1,8 +1,8 @@
 from dataclasses import dataclass
-from typing import List
+from typing import AsyncIterator, List
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatMessage:
     role: str  # "system" | "user" | "assistant"
     content: str
@@ -11,3 +11,10 @@ class ChatMessage:
 class LLMClient:
     async def chat(self, messages: List[ChatMessage]) -> str:
         raise NotImplementedError("chat() must be implemented by subclasses")
+
+    async def stream_chat(self, messages: List[ChatMessage]) -> AsyncIterator[str]:
+        """
+        Yield the reply as text chunks as the provider produces them.
+        Default: a single chunk holding the full chat() reply.
+        """
+        yield await self.chat(messages)
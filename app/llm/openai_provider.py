@@ -1,9 +1,12 @@
 import os
-from typing import List, Optional
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional
 
 from .base import LLMClient, ChatMessage
 from ..utils.logger import logger
 
+if TYPE_CHECKING:
+    import httpx
+
 try:
     from openai import AsyncOpenAI
 except ImportError:
@@ -11,12 +14,20 @@ except ImportError:
 
 
 class OpenAIClient(LLMClient):
-    def __init__(self, model: str, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        model: str,
+        api_key: Optional[str] = None,
+        http_client: Optional["httpx.AsyncClient"] = None,
+    ):
         if AsyncOpenAI is None:
             logger.warning("openai package not installed; OpenAI calls will be mocked")
             self.client = None
         else:
-            self.client = AsyncOpenAI(api_key=api_key or os.getenv("OPENAI_API_KEY"))
+            self.client = AsyncOpenAI(
+                api_key=api_key or os.getenv("OPENAI_API_KEY"),
+                http_client=http_client,
+            )
         self.model = model
 
     async def chat(self, messages: List[ChatMessage]) -> str:
@@ -31,3 +42,18 @@ class OpenAIClient(LLMClient):
             temperature=0.1,
         )
         return resp.choices[0].message.content
+
+    async def stream_chat(self, messages: List[ChatMessage]) -> AsyncIterator[str]:
+        if self.client is None:
+            yield await self.chat(messages)
+            return
+
+        stream = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": m.role, "content": m.content} for m in messages],
+            temperature=0.1,
+            stream=True,
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
@@ -1,8 +1,73 @@
-from typing import Dict, List
+from functools import lru_cache
+from typing import Dict, List, Optional, Type
 from .base import LLMClient
 from .openai_provider import OpenAIClient
 from .anthropic_provider import AnthropicClient
 from ..config import settings
+from ..utils.logger import logger
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+def _create_http_client() -> Optional["httpx.AsyncClient"]:
+    """
+    Shared HTTP client for all provider SDKs, so LLM calls reuse pooled
+    connections instead of paying a TCP/TLS handshake each time.
+    HTTP/2 is enabled when the optional `h2` package is installed.
+    """
+    if httpx is None:
+        return None
+    try:
+        import h2  # noqa: F401
+        http2 = True
+    except ImportError:
+        logger.info("h2 package not installed; LLM HTTP client uses HTTP/1.1")
+        http2 = False
+    return httpx.AsyncClient(
+        http2=http2,
+        limits=httpx.Limits(max_connections=256, max_keepalive_connections=64),
+        timeout=httpx.Timeout(600.0, connect=5.0),
+    )
+
+
+# Created lazily on first use and reset on shutdown, so a restarted
+# lifespan (tests, embedded servers) gets a fresh client.
+_HTTP_CLIENT: Optional["httpx.AsyncClient"] = None
+
+
+def _get_http_client() -> Optional["httpx.AsyncClient"]:
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None:
+        _HTTP_CLIENT = _create_http_client()
+    return _HTTP_CLIENT
+
+
+async def close_http_client() -> None:
+    """
+    Close the shared HTTP client (called on app shutdown) and drop the
+    cached SDK clients that still point at it.
+    """
+    global _HTTP_CLIENT
+    client, _HTTP_CLIENT = _HTTP_CLIENT, None
+    _get_client.cache_clear()
+    if client is not None:
+        await client.aclose()
+
+
+# Provider aliases → client class, resolved once at import time
+_PROVIDERS: Dict[str, Type[LLMClient]] = {
+    **dict.fromkeys(("openai", "gpt", "chatgpt"), OpenAIClient),
+    **dict.fromkeys(("anthropic", "claude"), AnthropicClient),
+}
+
+# Settings attribute holding the API key for each client class
+_API_KEY_SETTINGS: Dict[Type[LLMClient], str] = {
+    OpenAIClient: "OPENAI_API_KEY",
+    AnthropicClient: "ANTHROPIC_API_KEY",
+}
 
 
 # ---------------------------------------------------------
@@ -26,30 +91,33 @@ def create_llm_client(provider: str, model: str) -> LLMClient:
       - provider case-insensitive
       - standardized LLMClient API
       - normal chat mode compatibility
+      - one cached client per provider/model (see _get_client)
     """
     if not provider:
         raise ValueError("LLM provider is required.")
     if not model:
         raise ValueError("LLM model is required.")
 
-    provider = provider.strip().lower()
+    # Exact alias hits skip the strip/lower allocation
+    client_cls = _PROVIDERS.get(provider) or _PROVIDERS.get(provider.strip().lower())
 
-    # ---- OpenAI ----
-    if provider in ("openai", "gpt", "chatgpt"):
-        return OpenAIClient(
-            model=model,
-            api_key=settings.OPENAI_API_KEY
+    # ---- Unknown provider ----
+    if client_cls is None:
+        raise ValueError(
+            f"Unknown provider: {provider}. "
+            f"Supported: openai, anthropic"
         )
 
-    # ---- Anthropic Claude ----
-    if provider in ("anthropic", "claude"):
-        return AnthropicClient(
-            model=model,
-            api_key=settings.ANTHROPIC_API_KEY
-        )
+    api_key = getattr(settings, _API_KEY_SETTINGS[client_cls])
+    return _get_client(client_cls, model, api_key)
 
-    # ---- Unknown provider ----
-    raise ValueError(
-        f"Unknown provider: {provider}. "
-        f"Supported: openai, anthropic"
-    )
+
+@lru_cache(maxsize=64)
+def _get_client(
+    client_cls: Type[LLMClient], model: str, api_key: Optional[str]
+) -> LLMClient:
+    """
+    One client per (class, model, api_key), so the SDK client is reused
+    across calls. All clients share _HTTP_CLIENT's connection pool.
+    """
+    return client_cls(model=model, api_key=api_key, http_client=_get_http_client())
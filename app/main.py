@@ -1,12 +1,30 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
 
+from .llm.provider_registry import close_http_client
 from .routers import chat, jobs, meta
+from .tasks import cancel_running_jobs
 from .utils.logger import logger
 
-app = FastAPI(title="AI Agent Wrapper Backend")
+# Run behind uvicorn with the C event loop and HTTP parser:
+#   uvicorn app.main:app --loop uvloop --http httptools --workers N
+# (uvicorn's default "auto" also picks uvloop/httptools when installed)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # stop background jobs first; they still use the shared HTTP client
+    await cancel_running_jobs()
+    # release pooled LLM provider connections
+    await close_http_client()
+
+
+app = FastAPI(title="AI Agent Wrapper Backend", lifespan=lifespan)
 
 # CORS – adjust origins for your frontend (React/Vue/etc.)
 origins = [
@@ -38,3 +56,10 @@ app.include_router(jobs.router)
 @app.get("/")
 async def root():
     return {"message": "AI Agent Wrapper Backend is running"}
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # "auto" selects uvloop/httptools when installed, asyncio/h11 otherwise
+    uvicorn.run("app.main:app", loop="auto", http="auto")
@@ -1,4 +1,6 @@
-from fastapi import APIRouter, HTTPException
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException
 from ..services.chat_service import (
     create_chat,
     get_chat,
@@ -6,38 +8,72 @@ from ..services.chat_service import (
     add_message,
     run_normal_chat
 )
-from ..schemas import ChatCreateRequest, ChatResponse, MessageRequest, MessageResponse
+from ..dependencies import json_body_openapi, validated_body
+from ..schemas import (
+    CHAT_CREATE_ADAPTER,
+    MESSAGE_ADAPTER,
+    ChatCreateRequest,
+    ChatResponse,
+    MessageRequest,
+    MessageResponse,
+)
+from ..utils.responses import MsgspecJSONResponse, msgspec_responses
 
 router = APIRouter(prefix="/chats", tags=["Chats"])
 
 
-@router.post("", response_model=ChatResponse)
-async def create_chat_endpoint(req: ChatCreateRequest):
+# Chat responses are msgspec Structs returned as MsgspecJSONResponse,
+# bypassing FastAPI's response_model validation and encoding; their
+# OpenAPI schemas come from msgspec via `responses=`.
+@router.post(
+    "",
+    responses=msgspec_responses(ChatResponse),
+    openapi_extra=json_body_openapi(ChatCreateRequest),
+)
+async def create_chat_endpoint(
+    req: ChatCreateRequest = Depends(validated_body(CHAT_CREATE_ADAPTER)),
+):
     chat = create_chat(
         provider=req.provider,
         model=req.model,
         agent_id=req.agent_id,
         title=req.title,
     )
-    return ChatResponse.from_chat(chat)
+    return MsgspecJSONResponse(ChatResponse.from_chat(chat))
 
 
-@router.get("", response_model=list[ChatResponse])
+@router.get("", responses=msgspec_responses(List[ChatResponse]))
 async def list_chats_endpoint():
     chats = get_all_chats()
-    return [ChatResponse.from_chat(c) for c in chats]
+    return MsgspecJSONResponse([ChatResponse.from_chat(c) for c in chats])
 
 
-@router.get("/{chat_id}", response_model=ChatResponse)
+@router.get("/{chat_id}", responses=msgspec_responses(ChatResponse))
 async def get_chat_endpoint(chat_id: str):
-    chat = get_chat(chat_id)
-    return ChatResponse.from_chat(chat)
+    try:
+        chat = get_chat(chat_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Chat not found")
+
+    return MsgspecJSONResponse(ChatResponse.from_chat(chat))
 
 
 # ⭐ NEW — NORMAL CHAT MODE (NO AGENT, NO JOB)
-@router.post("/{chat_id}/message", response_model=MessageResponse)
-async def normal_chat_endpoint(chat_id: str, req: MessageRequest):
-    chat = get_chat(chat_id)
+# Documented via `responses` only; the reply is returned as-is without
+# response_model validation.
+@router.post(
+    "/{chat_id}/message",
+    responses={200: {"model": MessageResponse}},
+    openapi_extra=json_body_openapi(MessageRequest),
+)
+async def normal_chat_endpoint(
+    chat_id: str,
+    req: MessageRequest = Depends(validated_body(MESSAGE_ADAPTER)),
+):
+    try:
+        chat = get_chat(chat_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Chat not found")
 
     # If chat has agent_id → user must use /jobs endpoint instead
     if chat.agent_id:
@@ -46,10 +82,10 @@ async def normal_chat_endpoint(chat_id: str, req: MessageRequest):
             detail="This chat is configured for agent mode. Use /jobs/{chat_id} instead."
         )
 
-    # Run direct LLM chat
-    assistant_message = await run_normal_chat(chat_id, req.prompt)
+    # Run direct LLM chat on the chat already looked up above
+    assistant_message = await run_normal_chat(chat, req.prompt)
 
-    return MessageResponse(
-        chat_id=chat_id,
-        message=assistant_message
-    )
+    return MsgspecJSONResponse({
+        "chat_id": chat_id,
+        "message": assistant_message,
+    })
@@ -2,18 +2,47 @@ from pathlib import Path
 from typing import AsyncGenerator
 
 import asyncio
-from fastapi import APIRouter, HTTPException
+import msgspec
+from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import FileResponse, StreamingResponse, JSONResponse
 
-from ..schemas import JobCreateRequest, JobResponse
+from ..dependencies import json_body_openapi, validated_body
+from ..schemas import JOB_CREATE_ADAPTER, JobCreateRequest, JobResponse
 from ..services import job_service, job_manager
 from ..utils.logger import logger
+from ..utils.responses import MsgspecJSONResponse, msgspec_responses
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
+# Seconds of silence before an SSE keepalive comment is sent
+SSE_KEEPALIVE_SECONDS = 15
+SSE_PING = b": ping\n\n"
 
-@router.post("/{chat_id}", response_model=JobResponse)
-async def create_job_for_chat(chat_id: str, req: JobCreateRequest) -> JobResponse:
+
+def _sse_data(data: bytes, event: bytes = b"") -> bytes:
+    # One "data:" field per line, so multi-line chunks keep SSE framing
+    if b"\n" not in data:
+        return event + b"data: " + data + b"\n\n"
+    return event + b"".join(b"data: " + line + b"\n" for line in data.split(b"\n")) + b"\n"
+
+
+# Log lines use the default SSE "message" event; streamed LLM output is
+# sent as `event: token` so clients can tell reply text from status lines.
+_SSE_EVENT_FIELDS = {
+    job_manager.JobEvent.LOG: b"",
+    job_manager.JobEvent.TOKEN: b"event: token\n",
+}
+
+
+@router.post(
+    "/{chat_id}",
+    responses=msgspec_responses(JobResponse),
+    openapi_extra=json_body_openapi(JobCreateRequest),
+)
+async def create_job_for_chat(
+    chat_id: str,
+    req: JobCreateRequest = Depends(validated_body(JOB_CREATE_ADAPTER)),
+):
     """
     Create a job for a given chat and start background execution.
     """
@@ -22,18 +51,11 @@ async def create_job_for_chat(chat_id: str, req: JobCreateRequest) -> JobRespons
     # fire-and-forget execution inside this process
     job_service.start_job(job.id)
 
-    return JobResponse(
-        job_id=job.id,
-        chat_id=job.chat_id,
-        status=job.status,
-        result_message=job.result_message,
-        output_docx_url=f"/jobs/{job.id}/docx" if job.output_docx_path else None,
-        error=job.error,
-    )
+    return MsgspecJSONResponse(JobResponse.from_job(job))
 
 
-@router.get("/{job_id}", response_model=JobResponse)
-async def get_job_status(job_id: str) -> JobResponse:
+@router.get("/{job_id}", responses=msgspec_responses(JobResponse))
+async def get_job_status(job_id: str):
     """
     Retrieve the latest job state from the in-memory store.
     """
@@ -42,46 +64,53 @@ async def get_job_status(job_id: str) -> JobResponse:
     except KeyError:
         raise HTTPException(status_code=404, detail="Job not found")
 
-    return JobResponse(
-        job_id=job.id,
-        chat_id=job.chat_id,
-        status=job.status,
-        result_message=job.result_message,
-        output_docx_url=f"/jobs/{job.id}/docx" if job.output_docx_path else None,
-        error=job.error,
-    )
+    return MsgspecJSONResponse(JobResponse.from_job(job))
 
 
 @router.get("/{job_id}/events")
 async def stream_job_events(job_id: str):
     """
     Server-Sent Events (SSE) endpoint to stream job logs and final result.
-    The frontend can connect to this endpoint to receive incremental updates.
+    The frontend can connect to this endpoint to receive incremental updates:
+    log lines and the final result as default events, streamed LLM output
+    as `event: token`.
     """
+    if await job_manager.job_manager.get_job(job_id) is None:  # type: ignore[attr-defined]
+        raise HTTPException(status_code=404, detail="Job not found")
 
-    async def event_generator() -> AsyncGenerator[str, None]:
-        last_len = 0
-        while True:
-            state = await job_manager.job_manager.get_job(job_id)  # type: ignore[attr-defined]
-            if not state:
-                raise HTTPException(status_code=404, detail="Job not found")
-
-            logs = state.get("logs", [])
-            if len(logs) > last_len:
-                for line in logs[last_len:]:
-                    yield f"data: {line}\n\n"
-                last_len = len(logs)
-
-            if state["status"] in ("completed", "failed"):
-                import json
-
-                payload = json.dumps(
-                    {"status": state["status"], "result": state.get("result")}
-                )
-                yield f"data: {payload}\n\n"
-                break
-
-            await asyncio.sleep(0.5)
+    async def event_generator() -> AsyncGenerator[bytes, None]:
+        # Subscribe only once streaming starts, so a response that is never
+        # iterated cannot leave an orphaned queue behind.
+        queue = None
+        try:
+            subscription = await job_manager.job_manager.subscribe(job_id)  # type: ignore[attr-defined]
+            if subscription is None:
+                return
+            state, backlog_len, queue = subscription
+
+            # Index into the live log list instead of slicing a copy
+            logs = state["logs"]
+            for i in range(backlog_len):
+                yield _sse_data(logs[i].encode())
+
+            # Wait for pushed updates instead of polling the job state
+            while state["status"] not in job_manager.JobStatus.TERMINAL or not queue.empty():
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout=SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield SSE_PING
+                    continue
+                if item is not None:
+                    kind, text = item
+                    yield _sse_data(text.encode(), _SSE_EVENT_FIELDS[kind])
+
+            payload = msgspec.json.encode(
+                {"status": state["status"], "result": state.get("result")}
+            )
+            yield _sse_data(payload)
+        finally:
+            if queue is not None:
+                job_manager.job_manager.unsubscribe(job_id, queue)  # type: ignore[attr-defined]
 
     return StreamingResponse(event_generator(), media_type="text/event-stream")
 
@@ -1,23 +1,46 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, List, Literal
-from pydantic import BaseModel
+
+import msgspec
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+
+# Response-only schemas are msgspec Structs: they are built from trusted
+# MemoryStore objects and encoded straight to JSON (see utils/responses.py).
+# Request schemas stay Pydantic because they validate untrusted input.
+
+# Request bodies: reject unknown fields early, immutable once validated
+REQUEST_MODEL_CONFIG = ConfigDict(extra="forbid", frozen=True)
+
+# Response-only Pydantic models: build the core schema on first use
+RESPONSE_MODEL_CONFIG = ConfigDict(defer_build=True)
 
 
 # ---------------------------------------------------------
 # MESSAGE SCHEMA (used inside chats)
 # ---------------------------------------------------------
 
-class MessageSchema(BaseModel):
+class MessageSchema(msgspec.Struct):
     role: Literal["user", "assistant", "system"]
     content: str
     timestamp: datetime
 
 
+def _ns_to_datetime(ns: int) -> datetime:
+    """Convert a Message ns timestamp to an aware UTC datetime."""
+    seconds, rem = divmod(ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds, tz=timezone.utc).replace(
+        microsecond=rem // 1000
+    )
+
+
 # ---------------------------------------------------------
 # CHAT CREATION REQUEST
 # ---------------------------------------------------------
 
 class ChatCreateRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     provider: str
     model: str
     agent_id: Optional[str] = None   # None → Normal Chat Mode
@@ -28,7 +51,7 @@ class ChatCreateRequest(BaseModel):
 # CHAT RESPONSE (used for GET /chats & GET /chats/{id})
 # ---------------------------------------------------------
 
-class ChatResponse(BaseModel):
+class ChatResponse(msgspec.Struct, kw_only=True):
     id: str
     provider: str
     model: str
@@ -39,24 +62,30 @@ class ChatResponse(BaseModel):
     @classmethod
     def from_chat(cls, chat):
         """
-        Convert Chat dataclass → ChatResponse pydantic model.
+        Convert Chat dataclass → ChatResponse struct.
         This is required because our Chat is a dataclass stored
-        inside the MemoryStore, not a Pydantic model.
+        inside the MemoryStore, not a msgspec Struct.
+
+        Message structs are cached on the chat, so only messages added
+        since the last call are converted.
         """
+        cached = chat.response_messages
+        for m in chat.messages[len(cached):]:
+            cached.append(
+                MessageSchema(
+                    role=m.role,
+                    content=m.content,
+                    timestamp=_ns_to_datetime(m.timestamp),
+                )
+            )
+
         return cls(
             id=chat.id,
             provider=chat.provider,
             model=chat.model,
             agent_id=chat.agent_id,
             title=chat.title,
-            messages=[
-                MessageSchema(
-                    role=m.role,
-                    content=m.content,
-                    timestamp=m.timestamp,
-                )
-                for m in chat.messages
-            ]
+            messages=cached,
         )
 
 
@@ -65,10 +94,14 @@ class ChatResponse(BaseModel):
 # ---------------------------------------------------------
 
 class MessageRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     prompt: str
 
 
 class MessageResponse(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+
     chat_id: str
     message: str
 
@@ -77,7 +110,7 @@ class MessageResponse(BaseModel):
 # CHAT HISTORY (optional, for separate endpoint)
 # ---------------------------------------------------------
 
-class ChatHistoryResponse(BaseModel):
+class ChatHistoryResponse(msgspec.Struct):
     chat_id: str
     messages: List[MessageSchema]
 
@@ -87,10 +120,12 @@ class ChatHistoryResponse(BaseModel):
 # ---------------------------------------------------------
 
 class JobCreateRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     prompt: str
 
 
-class JobResponse(BaseModel):
+class JobResponse(msgspec.Struct, kw_only=True):
     job_id: str
     status: Literal["queued", "running", "completed", "failed"]
     chat_id: str
@@ -98,12 +133,39 @@ class JobResponse(BaseModel):
     output_docx_url: Optional[str] = None
     error: Optional[str] = None
 
+    @classmethod
+    def from_job(cls, job):
+        """
+        Convert Job dataclass → JobResponse struct.
+        """
+        return cls(
+            job_id=job.id,
+            chat_id=job.chat_id,
+            status=job.status,
+            result_message=job.result_message,
+            output_docx_url=f"/jobs/{job.id}/docx" if job.output_docx_path else None,
+            error=job.error,
+        )
+
+
+# ---------------------------------------------------------
+# REQUEST BODY ADAPTERS
+# Built once at import; routers validate raw JSON bodies with them
+# (see dependencies.validated_body).
+# ---------------------------------------------------------
+
+CHAT_CREATE_ADAPTER = TypeAdapter(ChatCreateRequest)
+MESSAGE_ADAPTER = TypeAdapter(MessageRequest)
+JOB_CREATE_ADAPTER = TypeAdapter(JobCreateRequest)
+
 
 # ---------------------------------------------------------
 # PROVIDER / MODEL LISTING
 # ---------------------------------------------------------
 
 class ProviderModelsResponse(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+
     data: dict
 
 
@@ -112,10 +174,14 @@ class ProviderModelsResponse(BaseModel):
 # ---------------------------------------------------------
 
 class AgentInfo(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+
     id: str
     name: str
     description: str
 
 
 class AgentsListResponse(BaseModel):
+    model_config = RESPONSE_MODEL_CONFIG
+
     data: List[AgentInfo]
@@ -1,42 +1,47 @@
-from datetime import datetime
-from .job_manager import job_manager
-from ..storage.memory_store import MEMORY_STORE
-from ..utils.ids import new_id
+from itertools import dropwhile
+from typing import List, Optional
+
+from ..storage.memory_store import MEMORY_STORE, Chat, Message, MessageRole
+from ..llm.base import ChatMessage
 from ..llm.provider_registry import create_llm_client
 
 
-def create_chat(provider: str, model: str, agent_id: str | None, title: str | None):
+def create_chat(
+    provider: str, model: str, agent_id: Optional[str], title: Optional[str]
+) -> Chat:
     chat = MEMORY_STORE.create_chat(provider, model, agent_id, title)
     return chat
 
 
-def get_chat(chat_id: str):
+def get_chat(chat_id: str) -> Chat:
     return MEMORY_STORE.get_chat(chat_id)
 
 
-def get_all_chats():
+def get_all_chats() -> List[Chat]:
     return MEMORY_STORE.get_all_chats()
 
 
-def add_message(chat, role: str, content: str):
-    return MEMORY_STORE.add_message(chat.id, role, content)
+def add_message(chat: Chat, role: MessageRole, content: str) -> Message:
+    return MEMORY_STORE.append_message(chat, role, content)
 
 
-# ⭐ NORMAL CHAT MODE (NO AGENT, NO JOB ENGINE)
-async def run_normal_chat(chat_id: str, prompt: str) -> str:
-    chat = get_chat(chat_id)
+def build_llm_history(chat: Chat, prompt: str) -> List[ChatMessage]:
+    """
+    LLM messages for a new user turn: the chat's context window plus prompt.
+    The window (CHAT_CONTEXT_WINDOW) evicts one message at a time, so it can
+    start mid-exchange; leading non-user entries are dropped because
+    providers such as Anthropic require the first turn to be from the user.
+    """
+    window = dropwhile(lambda m: m.role != "user", chat.llm_history)
+    return [*window, ChatMessage(role="user", content=prompt)]
 
-    # Build full history for LLM
-    history = [
-        {"role": m.role, "content": m.content}
-        for m in chat.messages
-    ]
-    history.append({"role": "user", "content": prompt})
 
-    llm = create_llm_client(chat.provider, chat.model)
-    response = await llm.chat(history)
+# ⭐ NORMAL CHAT MODE (NO AGENT, NO JOB ENGINE)
+async def run_normal_chat(chat: Chat, prompt: str) -> str:
+    history = build_llm_history(chat, prompt)
 
-    assistant_reply = response.text
+    llm = create_llm_client(chat.provider, chat.model)
+    assistant_reply = await llm.chat(history)
 
     # Save in chat history
     add_message(chat, "user", prompt)
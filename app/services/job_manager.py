@@ -5,7 +5,7 @@ Jobs have: id, status, logs, result, metadata.
 
 import asyncio
 import uuid
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Set, Tuple
 
 
 class JobStatus:
@@ -14,15 +14,28 @@ class JobStatus:
     COMPLETED = "completed"
     FAILED = "failed"
 
+    TERMINAL = (COMPLETED, FAILED)
+
+
+class JobEvent:
+    """Kinds of items pushed to SSE listener queues."""
+    LOG = "log"      # status/log line, also kept in job["logs"]
+    TOKEN = "token"  # streamed LLM output chunk, not stored
+
 
 class JobManager:
     def __init__(self) -> None:
         self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
         self._lock = asyncio.Lock()
 
-    async def create_job(self, metadata: Optional[Dict[str, Any]] = None) -> str:
+    async def create_job(
+        self,
+        metadata: Optional[Dict[str, Any]] = None,
+        job_id: Optional[str] = None,
+    ) -> str:
         async with self._lock:
-            job_id = str(uuid.uuid4())
+            job_id = job_id or str(uuid.uuid4())
             self._jobs[job_id] = {
                 "id": job_id,
                 "status": JobStatus.QUEUED,
@@ -50,9 +63,53 @@ class JobManager:
             if result is not None:
                 job["result"] = result
 
+            # Wake up SSE listeners; None means "state changed, no new line"
+            item = (JobEvent.LOG, log) if log else None
+            for queue in self._subscribers.get(job_id, ()):
+                queue.put_nowait(item)
+
+    async def push_token(self, job_id: str, text: str) -> None:
+        """
+        Send a streamed LLM output chunk to SSE listeners.
+        Tokens are not added to job["logs"]; the full text ends up in
+        the job result.
+        """
+        for queue in self._subscribers.get(job_id, ()):
+            queue.put_nowait((JobEvent.TOKEN, text))
+
     async def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
         async with self._lock:
             return self._jobs.get(job_id)
 
+    async def subscribe(
+        self, job_id: str
+    ) -> Optional[Tuple[Dict[str, Any], int, asyncio.Queue]]:
+        """
+        Register a listener for a job.
+        Returns (live job state, backlog length, queue of (JobEvent, text)
+        items or None for status-only changes),
+        or None if the job does not exist. Logs are append-only, so the
+        backlog is state["logs"][:backlog length] and needs no copy.
+        """
+        async with self._lock:
+            job = self._jobs.get(job_id)
+            if not job:
+                return None
+            queue: asyncio.Queue = asyncio.Queue()
+            self._subscribers.setdefault(job_id, set()).add(queue)
+            return job, len(job["logs"]), queue
+
+    def subscriber_count(self, job_id: str) -> int:
+        """Number of SSE listeners currently registered for a job."""
+        return len(self._subscribers.get(job_id, ()))
+
+    def unsubscribe(self, job_id: str, queue: asyncio.Queue) -> None:
+        queues = self._subscribers.get(job_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[job_id]
+
 
 job_manager = JobManager()
@@ -21,7 +21,8 @@ async def create_job(chat_id: str, prompt: str) -> Job:
 
     # Mirror job into the lightweight job_manager structure that powers SSE
     await job_manager.create_job(
-        metadata={"chat_id": chat_id, "agent_id": chat.agent_id}
+        metadata={"chat_id": chat_id, "agent_id": chat.agent_id},
+        job_id=job.id,
     )
 
     logger.info("[JobService] Created job %s for chat %s", job.id, chat_id)
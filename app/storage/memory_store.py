@@ -7,11 +7,14 @@ Suitable for development & single-process deployments.
 
 from __future__ import annotations
 
-import asyncio
+import time
 import uuid
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Deque, Dict, List, Literal, Optional
+
+from ..config import settings
+from ..llm.base import ChatMessage
 
 
 MessageRole = Literal["user", "assistant", "system"]
@@ -22,14 +25,14 @@ JobStatusType = Literal["queued", "running", "completed", "failed"]
 # Data models
 # ------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     role: MessageRole
     content: str
-    timestamp: datetime
+    timestamp: int  # ns since epoch (UTC); formatted only when serialized
 
 
-@dataclass
+@dataclass(slots=True)
 class Chat:
     id: str
     provider: str
@@ -37,9 +40,18 @@ class Chat:
     agent_id: Optional[str] = None
     title: Optional[str] = None
     messages: List[Message] = field(default_factory=list)
-
-
-@dataclass
+    # LLM-ready view of the last CHAT_CONTEXT_WINDOW `messages`, appended in
+    # lockstep by add_message; older entries are evicted in O(1).
+    # `messages` itself keeps the full history for the API.
+    llm_history: Deque[ChatMessage] = field(
+        default_factory=lambda: deque(maxlen=settings.CHAT_CONTEXT_WINDOW)
+    )
+    # Serialized form of `messages`, extended lazily by ChatResponse.from_chat.
+    # Messages are append-only, so cached entries never go stale.
+    response_messages: List[Any] = field(default_factory=list, init=False, repr=False)
+
+
+@dataclass(slots=True)
 class Job:
     id: str
     chat_id: str
@@ -68,7 +80,6 @@ class MemoryStore:
     def __init__(self) -> None:
         self.chats: Dict[str, Chat] = {}
         self.jobs: Dict[str, Job] = {}
-        self._lock = asyncio.Lock()
 
     # --------------------------------------------------------
     # CHAT HELPERS
@@ -100,13 +111,17 @@ class MemoryStore:
         return list(self.chats.values())
 
     def add_message(self, chat_id: str, role: MessageRole, content: str) -> Message:
-        chat = self.get_chat(chat_id)
+        return self.append_message(self.get_chat(chat_id), role, content)
+
+    def append_message(self, chat: Chat, role: MessageRole, content: str) -> Message:
+        """Like add_message, for callers that already hold the Chat."""
         message = Message(
             role=role,
             content=content,
-            timestamp=datetime.utcnow(),
+            timestamp=time.time_ns(),
         )
         chat.messages.append(message)
+        chat.llm_history.append(ChatMessage(role=role, content=content))
         return message
 
     # --------------------------------------------------------
@@ -148,23 +163,24 @@ class MemoryStore:
         error: Optional[str] = None,
     ) -> Job:
 
-        async with self._lock:
-            job = self.get_job(job_id)
-
-            if status is not None:
-                job.status = status
-            if log:
-                job.logs.append(log)
-            if result_message is not None:
-                job.result_message = result_message
-            if output_docx_path is not None:
-                job.output_docx_path = output_docx_path
-            if output_payload is not None:
-                job.output_payload = output_payload
-            if error is not None:
-                job.error = error
-
-            return job
+        # No await happens while the job is mutated, so the update is atomic
+        # on the event loop and needs no lock.
+        job = self.get_job(job_id)
+
+        if status is not None:
+            job.status = status
+        if log:
+            job.logs.append(log)
+        if result_message is not None:
+            job.result_message = result_message
+        if output_docx_path is not None:
+            job.output_docx_path = output_docx_path
+        if output_payload is not None:
+            job.output_payload = output_payload
+        if error is not None:
+            job.error = error
+
+        return job
 
 
 # Global singleton
@@ -9,15 +9,26 @@ No Celery is required — everything runs inside asyncio.
 """
 
 import asyncio
+from typing import Optional, Set, Tuple
 
+from .config import settings
 from .services.job_manager import job_manager, JobStatus
-from .services.chat_service import get_chat, add_message
+from .services.chat_service import get_chat, add_message, build_llm_history
 from .services.agent_registry import get_agent
 from .llm.provider_registry import create_llm_client
 from .storage.memory_store import MEMORY_STORE
 from .utils.logger import logger
 
 
+# Caps concurrent jobs (and so concurrent LLM connections). A Semaphore
+# binds to the loop that first waits on it, so one is kept per running
+# loop (see _get_job_semaphore); a new lifespan/loop gets a fresh one.
+_JOB_SEMAPHORE: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = None
+
+# Strong references to running tasks; the event loop only keeps weak ones
+_RUNNING_TASKS: Set[asyncio.Task] = set()
+
+
 async def _run_job(job_id: str) -> None:
     """
     Core async worker:
@@ -46,16 +57,15 @@ async def _run_job(job_id: str) -> None:
         if not chat.agent_id:  # None or empty string
             logger.info("[Worker] Normal chat mode for job %s", job_id)
 
-            # Build conversation history for LLM
-            messages = [
-                {"role": m.role, "content": m.content}
-                for m in chat.messages
-            ]
-            messages.append({"role": "user", "content": prompt})
+            # Conversation history is kept in LLM form on the chat
+            messages = build_llm_history(chat, prompt)
 
-            response = await llm_client.chat(messages)
-
-            result_text = response.text
+            # Push chunks to SSE listeners as they arrive
+            parts = []
+            async for chunk in llm_client.stream_chat(messages):
+                parts.append(chunk)
+                await job_manager.push_token(job_id, chunk)
+            result_text = "".join(parts)
 
             # Save assistant message into chat history
             add_message(chat, "assistant", result_text)
@@ -131,10 +141,54 @@ async def _run_job(job_id: str) -> None:
         )
 
 
+async def _run_job_bounded(job_id: str) -> None:
+    """
+    Run a job once a concurrency slot is free.
+    Until then the job stays in "queued" status.
+    """
+    try:
+        async with _get_job_semaphore():
+            await _run_job(job_id)
+    except asyncio.CancelledError:
+        # App shutdown (see cancel_running_jobs): don't leave it "queued"/"running"
+        logger.warning("[Worker] Job %s cancelled", job_id)
+        await MEMORY_STORE.update_job(
+            job_id,
+            status="failed",
+            log="Job cancelled",
+            error="Job cancelled",
+        )
+        await job_manager.update_job(
+            job_id,
+            status=JobStatus.FAILED,
+            log="Job cancelled",
+        )
+        raise
+
+
+def _get_job_semaphore() -> asyncio.Semaphore:
+    global _JOB_SEMAPHORE
+    loop = asyncio.get_running_loop()
+    if _JOB_SEMAPHORE is None or _JOB_SEMAPHORE[0] is not loop:
+        _JOB_SEMAPHORE = (loop, asyncio.Semaphore(settings.MAX_CONCURRENT_JOBS))
+    return _JOB_SEMAPHORE[1]
+
+
+async def cancel_running_jobs() -> None:
+    """
+    Cancel running and queued jobs and wait for them to finish
+    (called on app shutdown, before the shared HTTP client is closed).
+    """
+    tasks = list(_RUNNING_TASKS)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
 def launch_job(job_id: str) -> None:
     """
     Fire-and-forget launcher.
-    If event loop exists → create_task()
+    If event loop exists → create_task() (bounded by MAX_CONCURRENT_JOBS)
     Else → asyncio.run()
     """
     try:
@@ -143,6 +197,8 @@ def launch_job(job_id: str) -> None:
         loop = None
 
     if loop and loop.is_running():
-        loop.create_task(_run_job(job_id))
+        task = loop.create_task(_run_job_bounded(job_id))
+        _RUNNING_TASKS.add(task)
+        task.add_done_callback(_RUNNING_TASKS.discard)
     else:
         asyncio.run(_run_job(job_id))
@@ -0,0 +1,46 @@
+from typing import Any, Dict
+
+import msgspec
+from fastapi.responses import Response
+
+
+_encoder = msgspec.json.Encoder()
+
+
+class MsgspecJSONResponse(Response):
+    """
+    JSON response encoded with msgspec.
+    Bypasses FastAPI's jsonable_encoder / Pydantic serialization,
+    so return it directly from routes without a response_model.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return _encoder.encode(content)
+
+
+def msgspec_responses(tp: Any) -> Dict[int, Dict[str, Any]]:
+    """
+    `responses=` value documenting a MsgspecJSONResponse body of type `tp`
+    (a Struct or e.g. List[Struct]). FastAPI cannot derive schemas from
+    msgspec types, so the schema is generated by msgspec and inlined.
+    """
+    (schema,), components = msgspec.json.schema_components([tp], ref_template="{name}")
+    return {
+        200: {
+            "description": "Successful Response",
+            "content": {"application/json": {"schema": _inline_refs(schema, components)}},
+        }
+    }
+
+
+def _inline_refs(node: Any, components: Dict[str, Any]) -> Any:
+    # Response structs are not recursive, so every $ref can be inlined
+    if isinstance(node, dict):
+        if "$ref" in node:
+            return _inline_refs(components[node["$ref"]], components)
+        return {k: _inline_refs(v, components) for k, v in node.items()}
+    if isinstance(node, list):
+        return [_inline_refs(v, components) for v in node]
+    return node
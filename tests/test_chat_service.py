@@ -0,0 +1,43 @@
+from app.config import settings
+from app.services.chat_service import build_llm_history
+from app.storage.memory_store import Chat, MemoryStore
+
+
+def _chat_with(roles, monkeypatch, window):
+    monkeypatch.setattr(settings, "CHAT_CONTEXT_WINDOW", window)
+    chat = Chat(id="chat_test", provider="openai", model="m")
+    store = MemoryStore()
+    for i, role in enumerate(roles):
+        store.append_message(chat, role, f"{role} {i}")
+    return chat
+
+
+def test_history_window_starts_with_user_turn(monkeypatch):
+    # odd-length chat longer than the window: window is [a1, u2, a3, u4]
+    chat = _chat_with(["user", "assistant", "user", "assistant", "user"], monkeypatch, 4)
+    assert [m.role for m in chat.llm_history] == ["assistant", "user", "assistant", "user"]
+
+    history = build_llm_history(chat, "next")
+
+    assert [(m.role, m.content) for m in history] == [
+        ("user", "user 2"),
+        ("assistant", "assistant 3"),
+        ("user", "user 4"),
+        ("user", "next"),
+    ]
+    # full history is kept for the API
+    assert len(chat.messages) == 5
+
+
+def test_history_without_user_turns_is_just_the_prompt(monkeypatch):
+    # job-mode chats only record assistant replies
+    chat = _chat_with(["assistant", "assistant", "assistant"], monkeypatch, 2)
+    history = build_llm_history(chat, "next")
+    assert [(m.role, m.content) for m in history] == [("user", "next")]
+
+
+def test_unbounded_history_keeps_everything(monkeypatch):
+    chat = _chat_with(["user", "assistant"] * 3, monkeypatch, None)
+    history = build_llm_history(chat, "next")
+    assert len(history) == 7
+    assert history[0].content == "user 0"
@@ -0,0 +1,120 @@
+import asyncio
+import gc
+
+import pytest
+from fastapi import HTTPException
+
+from app.routers.jobs import stream_job_events
+from app.services import job_manager as job_manager_module
+from app.services.job_manager import JobManager, JobStatus
+
+
+@pytest.fixture
+def job_manager(monkeypatch) -> JobManager:
+    # Fresh manager per test, seen by the router through the module attribute
+    manager = JobManager()
+    monkeypatch.setattr(job_manager_module, "job_manager", manager)
+    return manager
+
+
+def test_stream_replays_backlog_then_pushes_live_updates(job_manager):
+    async def scenario():
+        job_id = await job_manager.create_job(job_id="job_test_stream")
+        await job_manager.update_job(job_id, status=JobStatus.RUNNING, log="Job started")
+
+        response = await stream_job_events(job_id)
+        frames = response.body_iterator
+
+        # backlog written before the client connected
+        assert await frames.__anext__() == b"data: Job started\n\n"
+        assert job_manager.subscriber_count(job_id) == 1
+
+        # live update pushed after the client connected
+        await job_manager.update_job(job_id, log="step 1")
+        assert await frames.__anext__() == b"data: step 1\n\n"
+
+        # streamed LLM output is framed as its own event and not logged
+        await job_manager.push_token(job_id, "Hel")
+        await job_manager.push_token(job_id, "lo\nworld")
+        assert await frames.__anext__() == b"event: token\ndata: Hel\n\n"
+        assert await frames.__anext__() == b"event: token\ndata: lo\ndata: world\n\n"
+        assert (await job_manager.get_job(job_id))["logs"] == ["Job started", "step 1"]
+
+        await job_manager.update_job(
+            job_id,
+            status=JobStatus.COMPLETED,
+            log="done",
+            result={"text": "hi"},
+        )
+        assert await frames.__anext__() == b"data: done\n\n"
+        assert await frames.__anext__() == (
+            b'data: {"status":"completed","result":{"text":"hi"}}\n\n'
+        )
+        with pytest.raises(StopAsyncIteration):
+            await frames.__anext__()
+
+        assert job_manager.subscriber_count(job_id) == 0
+
+    asyncio.run(scenario())
+
+
+def test_stream_for_finished_job_sends_backlog_and_result(job_manager):
+    async def scenario():
+        job_id = await job_manager.create_job(job_id="job_test_finished")
+        await job_manager.update_job(job_id, status=JobStatus.FAILED, log="Job failed: boom")
+
+        response = await stream_job_events(job_id)
+        frames = [frame async for frame in response.body_iterator]
+
+        assert frames == [
+            b"data: Job failed: boom\n\n",
+            b'data: {"status":"failed","result":null}\n\n',
+        ]
+        assert job_manager.subscriber_count(job_id) == 0
+
+    asyncio.run(scenario())
+
+
+def test_unstarted_or_closed_stream_leaves_no_subscriber(job_manager):
+    async def scenario():
+        job_id = await job_manager.create_job(job_id="job_test_cleanup")
+
+        # response dropped before the body is iterated
+        response = await stream_job_events(job_id)
+        del response
+        gc.collect()
+        assert job_manager.subscriber_count(job_id) == 0
+
+        # client disconnects mid-stream
+        await job_manager.update_job(job_id, log="Job started")
+        response = await stream_job_events(job_id)
+        frames = response.body_iterator
+        await frames.__anext__()
+        assert job_manager.subscriber_count(job_id) == 1
+        await frames.aclose()
+        assert job_manager.subscriber_count(job_id) == 0
+
+    asyncio.run(scenario())
+
+
+def test_stream_unknown_job_is_404(job_manager):
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(stream_job_events("job_missing"))
+    assert exc_info.value.status_code == 404
+
+
+def test_unsubscribed_queue_stops_receiving_updates(job_manager):
+    async def scenario():
+        job_id = await job_manager.create_job(job_id="job_test_unsubscribe")
+        state, backlog_len, queue = await job_manager.subscribe(job_id)
+
+        await job_manager.update_job(job_id, log="first")
+        assert queue.qsize() == 1
+
+        job_manager.unsubscribe(job_id, queue)
+        await job_manager.update_job(job_id, log="second")
+        await job_manager.push_token(job_id, "tok")
+        assert queue.qsize() == 1
+        assert state["logs"] == ["first", "second"]
+
+    asyncio.run(scenario())
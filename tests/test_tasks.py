@@ -0,0 +1,60 @@
+import asyncio
+import threading
+import time
+
+from fastapi.testclient import TestClient
+
+from app import tasks
+from app.config import settings
+from app.main import app
+from app.storage.memory_store import MEMORY_STORE
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out waiting for jobs"
+        time.sleep(0.01)
+
+
+def _start_jobs(client: TestClient, count: int) -> list:
+    chat_id = client.post("/chats", json={"provider": "openai", "model": "m"}).json()["id"]
+    return [
+        client.post(f"/jobs/{chat_id}", json={"prompt": "hi"}).json()["job_id"]
+        for _ in range(count)
+    ]
+
+
+def test_job_limit_works_across_lifespans(monkeypatch):
+    finished = []
+
+    async def slow_job(job_id: str) -> None:
+        await asyncio.sleep(0.2)
+        finished.append(job_id)
+
+    monkeypatch.setattr(tasks, "_run_job", slow_job)
+
+    # Jobs contend for the semaphore in both lifespans (separate event loops)
+    for _ in range(2):
+        with TestClient(app) as client:
+            job_ids = _start_jobs(client, settings.MAX_CONCURRENT_JOBS + 2)
+            _wait_for(lambda: all(job_id in finished for job_id in job_ids))
+
+
+def test_shutdown_cancels_running_jobs(monkeypatch):
+    started = threading.Event()
+
+    async def stuck_job(job_id: str) -> None:
+        started.set()
+        await asyncio.Event().wait()
+
+    monkeypatch.setattr(tasks, "_run_job", stuck_job)
+
+    with TestClient(app) as client:
+        (job_id,) = _start_jobs(client, 1)
+        assert started.wait(timeout=5)
+
+    job = MEMORY_STORE.get_job(job_id)
+    assert job.status == "failed"
+    assert job.error == "Job cancelled"
+    assert job.logs[-1] == "Job cancelled"
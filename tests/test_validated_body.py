@@ -0,0 +1,108 @@
+from typing import List
+
+from fastapi import Depends, FastAPI, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, TypeAdapter
+
+from app.dependencies import validated_body
+from app.main import app
+
+
+class Item(BaseModel):
+    name: str
+    qty: int
+
+
+class Order(BaseModel):
+    items: List[Item]
+
+
+ORDER_ADAPTER = TypeAdapter(Order)
+
+order_app = FastAPI()
+
+
+@order_app.post("/orders")
+async def create_order(order: Order = Depends(validated_body(ORDER_ADAPTER))):
+    return {"count": len(order.items)}
+
+
+@order_app.exception_handler(RequestValidationError)
+async def echo_body_handler(request: Request, exc: RequestValidationError):
+    body = exc.body.decode() if isinstance(exc.body, bytes) else exc.body
+    return JSONResponse(
+        status_code=422,
+        content=jsonable_encoder({"detail": exc.errors(), "body": body}),
+    )
+
+
+client = TestClient(order_app)
+
+
+def _post(content: str, content_type: str | None = "application/json"):
+    headers = {"content-type": content_type} if content_type else {}
+    return client.post("/orders", content=content, headers=headers)
+
+
+def test_valid_json_body():
+    resp = _post('{"items": [{"name": "a", "qty": 1}]}')
+    assert resp.status_code == 200
+    assert resp.json() == {"count": 1}
+
+
+def test_json_subtype_and_charset_accepted():
+    body = '{"items": []}'
+    assert _post(body, "application/merge-patch+json").status_code == 200
+    assert _post(body, "application/json; charset=utf-8").status_code == 200
+
+
+def test_text_plain_rejected():
+    resp = _post('{"items": []}', "text/plain")
+    assert resp.status_code == 422
+    (err,) = resp.json()["detail"]
+    assert err["type"] == "model_attributes_type"
+    assert err["loc"] == ["body"]
+    assert resp.json()["body"] == '{"items": []}'
+
+
+def test_missing_content_type_rejected():
+    resp = _post('{"items": []}', None)
+    assert resp.status_code == 422
+    assert resp.json()["detail"][0]["type"] == "model_attributes_type"
+
+
+def test_empty_body_is_missing():
+    resp = _post("")
+    assert resp.status_code == 422
+    assert resp.json()["detail"] == [
+        {"type": "missing", "loc": ["body"], "msg": "Field required", "input": None}
+    ]
+
+
+def test_invalid_json():
+    resp = _post("{bad")
+    assert resp.status_code == 422
+    (err,) = resp.json()["detail"]
+    assert err["type"] == "json_invalid"
+    assert err["loc"] == ["body"]
+    assert resp.json()["body"] == "{bad"
+
+
+def test_nested_field_error_loc():
+    resp = _post('{"items": [{"name": "a", "qty": "many"}]}')
+    assert resp.status_code == 422
+    (err,) = resp.json()["detail"]
+    assert err["type"] == "int_parsing"
+    assert err["loc"] == ["body", "items", 0, "qty"]
+    assert "url" not in err
+
+
+def test_chat_routes_reject_cross_origin_simple_requests():
+    with TestClient(app) as app_client:
+        body = '{"provider": "openai", "model": "m"}'
+        for content_type in ("text/plain", "application/x-www-form-urlencoded"):
+            resp = app_client.post("/chats", content=body, headers={"content-type": content_type})
+            assert resp.status_code == 422